@@ -4,8 +4,6 @@ from collections import ChainMap
 from typing import Tuple
 
 from packaging import version
-from plumbum import local
-from plumbum.cmd import git
 
 from .. import vcs
 from ..types import AnyByStrDict, OptAnyByStrDict, OptBool, OptStr, OptStrSeq
@@ -107,8 +105,7 @@ def make_config(
         if repo:
             src_path = vcs.clone(repo, vcs_ref or "HEAD")
             vcs_ref = vcs_ref or vcs.checkout_latest_tag(src_path, use_prereleases)
-            with local.cwd(src_path):
-                init_args["commit"] = git("describe", "--tags", "--always").strip()
+            init_args["commit"] = vcs.describe_commit(src_path)
         init_args["src_path"] = src_path
     # Obtain config and query data, asking the user if needed
     file_data = load_config_data(src_path, quiet=True)
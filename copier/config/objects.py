@@ -5,7 +5,16 @@ from copy import deepcopy
 from hashlib import sha512
 from os import urandom
 from pathlib import Path
-from typing import Any, ChainMap as t_ChainMap, Sequence, Tuple, Union
+from typing import (
+    Any,
+    ChainMap as t_ChainMap,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 from pydantic import BaseModel, Extra, Field, PrivateAttr, StrictBool, validator
 
@@ -30,6 +39,39 @@ DEFAULT_DATA: AnyByStrDict = {
 
 DEFAULT_TEMPLATES_SUFFIX = ".tmpl"
 
+_IMMUTABLE_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _copy_answer(value: Any, memo: Optional[Dict[int, Any]] = None) -> Any:
+    """Deep copy JSON-like data without the generic `deepcopy` machinery.
+
+    Like `deepcopy`, shared and cyclic references are kept as such through
+    `memo`. Anything that isn't JSON-like is still copied with `deepcopy`.
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if memo is None:
+        memo = {}
+    key = id(value)
+    if key in memo:
+        return memo[key]
+    if value_type is dict:
+        copied_dict: Dict[Any, Any] = {}
+        memo[key] = copied_dict
+        copied_dict.update((k, _copy_answer(v, memo)) for k, v in value.items())
+        return copied_dict
+    if value_type is list:
+        copied_list: List[Any] = []
+        memo[key] = copied_list
+        copied_list.extend(_copy_answer(v, memo) for v in value)
+        return copied_list
+    if value_type is tuple:
+        copied_tuple = tuple(_copy_answer(v, memo) for v in value)
+        # Its items may have reached the tuple again through a mutable container
+        return memo.setdefault(key, copied_tuple)
+    return deepcopy(value, memo)
+
 
 class UserMessageError(Exception):
     """Exit the program giving a message to the user."""
@@ -129,7 +171,7 @@ class ConfigData(BaseModel):
     )
     def dict_copy(cls, v: AnyByStrDict) -> AnyByStrDict:
         """Make sure all dicts are copied."""
-        return deepcopy(v)
+        return _copy_answer(v)
 
     @property
     def data(self) -> t_ChainMap[str, Any]:
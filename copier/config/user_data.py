@@ -24,6 +24,9 @@ from .objects import DEFAULT_DATA, EnvOps, UserMessageError
 
 __all__ = ("load_config_data", "query_user_data")
 
+# Use the libyaml-based loader when PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigFileError(ValueError):
     pass
@@ -438,7 +441,7 @@ def parse_yaml_string(string: str) -> Any:
     to repeat falied questions.
     """
     try:
-        return yaml.safe_load(string)
+        return yaml.load(string, Loader=YAML_SAFE_LOADER)
     except yaml.error.YAMLError as error:
         raise ValueError(str(error))
 
@@ -468,7 +471,7 @@ def load_answersfile_data(
     """Load answers data from a `$dst_path/$answers_file` file if it exists."""
     try:
         with open(Path(dst_path) / (answers_file or ".copier-answers.yml")) as fd:
-            return yaml.safe_load(fd)
+            return yaml.load(fd, Loader=YAML_SAFE_LOADER)
     except FileNotFoundError:
         return {}
 
@@ -2,6 +2,7 @@
 
 import filecmp
 import os
+import re
 import shutil
 import subprocess
 import sys
@@ -23,9 +24,11 @@ from .tools import (
     Style,
     copy_file,
     create_path_filter,
+    encode_text,
     get_migration_tasks,
     make_folder,
     printf,
+    write_file,
 )
 from .types import (
     AnyByStrDict,
@@ -39,6 +42,12 @@ from .types import (
 
 __all__ = ("copy", "copy_local")
 
+# Bytes read at once when comparing a rendered file with its destination
+COMPARE_CHUNK_SIZE = 1024 * 1024
+
+# Task commands containing any of these need a shell to be interpreted
+SHELL_METACHARS = re.compile(r"[|&;<>()$`\\\"'*?\[\]#~=%!{}\n]")
+
 
 def copy(
     src_path: OptStr = None,
@@ -183,8 +192,11 @@ def copy_local(conf: ConfigData) -> None:
     if conf.subdirectory is not None:
         src_path /= conf.subdirectory
 
+    walked: List[Tuple[Path, List[Tuple[Path, Path]]]] = []
+    # os.walk yields folders as strings prefixed with the walked root
+    src_prefix_len = len(str(src_path))
     for folder, sub_dirs, files in os.walk(src_path):
-        rel_folder = str(folder).replace(str(src_path), "", 1).lstrip(os.path.sep)
+        rel_folder = folder[src_prefix_len:].lstrip(os.path.sep)
         rel_folder = render.string(rel_folder)
         rel_folder = str(rel_folder).replace("." + os.path.sep, ".", 1)
 
@@ -196,11 +208,23 @@ def copy_local(conf: ConfigData) -> None:
         folder = Path(folder)
         rel_folder = Path(rel_folder)
 
-        render_folder(rel_folder, conf)
-
         source_paths = get_source_paths(
             conf, folder, rel_folder, files, render, must_filter
         )
+        walked.append((rel_folder, source_paths))
+
+    # Templated files don't depend on each other, so they can be rendered upfront
+    render.prerender(
+        [
+            source_path
+            for _, source_paths in walked
+            for source_path, _ in source_paths
+            if str(source_path).endswith(conf.templates_suffix)
+        ]
+    )
+
+    for rel_folder, source_paths in walked:
+        render_folder(rel_folder, conf)
         for source_path, rel_path in source_paths:
             render_file(conf, rel_path, source_path, render, must_skip)
 
@@ -221,13 +245,11 @@ def update_diff(conf: ConfigData) -> None:
         conf: Configuration obtained with [`make_config`][copier.config.factory.make_config].
     """
     # Ensure local repo is clean
-    if vcs.is_git_repo_root(conf.dst_path):
-        with local.cwd(conf.dst_path):
-            if git("status", "--porcelain"):
-                raise UserMessageError(
-                    "Destination repository is dirty; cannot continue. "
-                    "Please commit or stash your local changes and retry."
-                )
+    if vcs.is_git_repo_root(conf.dst_path) and vcs.is_dirty(conf.dst_path):
+        raise UserMessageError(
+            "Destination repository is dirty; cannot continue. "
+            "Please commit or stash your local changes and retry."
+        )
     last_answers = load_answersfile_data(conf.dst_path, conf.answers_file)
     downgrading = False
     if conf.old_commit and conf.commit:
@@ -324,16 +346,16 @@ def get_source_paths(
         The list of files to render.
     """
     source_paths = []
-    files_set = set(files)
-    for src_name in files:
-        src_name = str(src_name)
-        if f"{src_name}{conf.templates_suffix}" in files_set:
+    suffix = conf.templates_suffix
+    suffix_len = len(suffix)
+    names = [str(src_name) for src_name in files]
+    templated = {src_name for src_name in names if src_name.endswith(suffix)}
+    # Files that have a templated sibling get rendered from that one
+    shadowed = {src_name[:-suffix_len] for src_name in templated}
+    for src_name in names:
+        if src_name in shadowed:
             continue
-        dst_name = (
-            src_name[: -len(conf.templates_suffix)]
-            if src_name.endswith(conf.templates_suffix)
-            else src_name
-        )
+        dst_name = src_name[:-suffix_len] if src_name in templated else src_name
         dst_name = render.string(dst_name)
         rel_path = rel_folder / dst_name
 
@@ -393,14 +415,16 @@ def render_file(
         must_skip: A callable telling whether to skip a file.
     """
     content: Optional[str] = None
+    encoded: Optional[bytes] = None
     if str(src_path).endswith(conf.templates_suffix):
         content = render(src_path)
+        encoded = encode_text(content)
 
     dst_path = conf.dst_path / rel_path
 
     if not dst_path.exists():
         printf("create", rel_path, style=Style.OK, quiet=conf.quiet, file_=sys.stderr)
-    elif files_are_identical(src_path, dst_path, content):
+    elif files_are_identical(src_path, dst_path, content, encoded):
         printf(
             "identical",
             rel_path,
@@ -421,25 +445,50 @@ def render_file(
 
     if conf.pretend:
         pass
-    elif content is None:
+    elif encoded is None:
         copy_file(src_path, dst_path)
     else:
-        dst_path.write_text(content)
+        write_file(dst_path, encoded)
 
 
-def files_are_identical(src_path: Path, dst_path: Path, content: Optional[str]) -> bool:
+def files_are_identical(
+    src_path: Path,
+    dst_path: Path,
+    content: Optional[str],
+    encoded: Optional[bytes] = None,
+) -> bool:
     """Tell whether two files are identical.
 
     Arguments:
         src_path: Source file.
         dst_path: Destination file.
         content: File contents.
+        encoded: File contents as [`encode_text`][copier.tools.encode_text] returns.
 
     Returns:
         True if the files are identical, False otherwise.
     """
     if content is None:
         return filecmp.cmp(str(src_path), str(dst_path), shallow=False)
+    if encoded is None:
+        encoded = encode_text(content)
+    size = dst_path.stat().st_size
+    # Newline translation can only account for one byte per line
+    if abs(size - len(encoded)) > content.count("\n"):
+        return False
+    if size == len(encoded):
+        # Compare in chunks to avoid loading big destination files whole
+        view = memoryview(encoded)
+        with dst_path.open("rb") as dst_file:
+            for start in range(0, len(view), COMPARE_CHUNK_SIZE):
+                chunk = dst_file.read(COMPARE_CHUNK_SIZE)
+                if chunk != view[start : start + COMPARE_CHUNK_SIZE]:
+                    break
+            else:
+                return True
+        if b"\r" not in chunk:
+            return False
+    # Line endings may still differ, which text mode reading ignores
     return dst_path.read_text() == content
 
 
@@ -471,6 +520,7 @@ def run_tasks(conf: ConfigData, render: Renderer, tasks: Sequence[Dict]) -> None
         render: The [template renderer][copier.tools.Renderer] instance.
         tasks: The list of tasks to run.
     """
+    base_env = dict(os.environ)
     for i, task in enumerate(tasks):
         task_cmd = task["task"]
         use_shell = isinstance(task_cmd, str)
@@ -483,5 +533,19 @@ def run_tasks(conf: ConfigData, render: Renderer, tasks: Sequence[Dict]) -> None
                 colors.info | f" > Running task {i + 1} of {len(tasks)}: {task_cmd}",
                 file=sys.stderr,
             )
-        with local.cwd(conf.dst_path), local.env(**task.get("extra_env", {})):
-            subprocess.run(task_cmd, shell=use_shell, check=True, env=local.env)
+        env = dict(base_env, **task.get("extra_env", {}))
+        # A plain program invocation doesn't need a shell in between, but only
+        # POSIX shells run a PATH lookup the same way executing directly does
+        if use_shell and os.name == "posix" and not SHELL_METACHARS.search(task_cmd):
+            args = task_cmd.split()
+            if args and os.sep not in args[0]:
+                program = shutil.which(args[0], path=env.get("PATH"))
+                if program:
+                    task_cmd, use_shell = [program, *args[1:]], False
+        subprocess.run(
+            task_cmd,
+            shell=use_shell,
+            check=True,
+            cwd=conf.dst_path,
+            env=env,
+        )
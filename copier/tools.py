@@ -1,13 +1,19 @@
 """Some utility functions."""
 
 import errno
+import locale
+import multiprocessing
 import os
 import shutil
 import sys
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO, Union
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, List, Optional, TextIO, Tuple, Union
 
 import colorama
 import pathspec
@@ -48,6 +54,15 @@ HLINE = "-" * 42
 
 NO_VALUE: object = object()
 
+# Minimum amount of templates to render them in parallel worker processes
+PARALLEL_RENDER_THRESHOLD = 32
+
+# Only set inside worker processes, by `_set_worker_renderer`
+_worker_renderer: Optional["Renderer"] = None
+
+# Characters with a special meaning in gitignore-style patterns
+_SPECIAL_PATTERN_CHARS = frozenset("*?[]\\!#/")
+
 
 def printf(
     action: str,
@@ -126,6 +141,29 @@ def copy_file(src_path: Path, dst_path: Path, follow_symlinks: bool = True) -> N
     shutil.copy2(src_path, dst_path, follow_symlinks=follow_symlinks)
 
 
+def encode_text(text: str) -> bytes:
+    """Encode `text` like writing it to a file opened in text mode would."""
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    return text.encode(locale.getpreferredencoding(False))
+
+
+def write_file(dst_path: Path, content: bytes) -> None:
+    """Write `content` to `dst_path` straight through the file descriptor.
+
+    Bytes are written as given; get them from [`encode_text`][copier.tools.encode_text]
+    to produce the same file as a text mode write.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(str(dst_path), flags, 0o666)
+    try:
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def to_nice_yaml(data: Any, **kwargs) -> str:
     """Dump a string to pretty YAML."""
     # Remove security-problematic kwargs
@@ -149,7 +187,8 @@ def get_jinja_env(
     # so we use the SandboxedEnvironment instead of the regular one.
     # Of couse we still have the post-copy tasks to worry about, but at least
     # they are more visible to the final user.
-    env = SandboxedEnvironment(loader=loader, **envops.dict(), **kwargs)
+    # Options from the template take precedence over the caller's defaults
+    env = SandboxedEnvironment(loader=loader, **{**kwargs, **envops.dict()})
     default_filters = {"to_nice_yaml": to_nice_yaml}
     default_filters.update(filters or {})
     env.filters.update(default_filters)
@@ -162,8 +201,30 @@ class Renderer:
     def __init__(self, conf: "ConfigData") -> None:
         envops: "EnvOps" = conf.envops
         paths = [str(conf.src_path)] + list(map(str, conf.extra_paths or []))
-        self.env = get_jinja_env(envops=envops, paths=paths)
+        # Template files don't change during a run; skip the staleness checks
+        self.env = get_jinja_env(envops=envops, paths=paths, auto_reload=False)
+        # Path parts and task commands repeat a lot; compile each source once
+        self._compile_string = lru_cache(maxsize=2048)(self.env.from_string)
+        # Strings without any of these render to themselves; line breaks count
+        # as markers because Jinja may normalize or strip them
+        self._markers = tuple(
+            marker
+            for marker in (
+                self.env.block_start_string,
+                self.env.variable_start_string,
+                self.env.comment_start_string,
+                self.env.line_statement_prefix,
+                self.env.line_comment_prefix,
+                "\n",
+                "\r",
+            )
+            if marker
+        )
         self.conf = conf
+        self._src_prefix = os.path.join(str(conf.src_path), "")
+        self._prerendered: Dict[str, str] = {}
+        # Flatten the layered `conf.data` once, so lookups don't walk each layer
+        data: AnyByStrDict = dict(conf.data)
         answers: AnyByStrDict = {}
         # All internal values must appear first
         if conf.commit:
@@ -171,28 +232,108 @@ class Renderer:
         if conf.original_src_path is not None:
             answers["_src_path"] = conf.original_src_path
         # Other data goes next
+        secret_questions = frozenset(conf.secret_questions)
         answers.update(
             (k, v)
-            for (k, v) in conf.data.items()
+            for (k, v) in data.items()
             if not k.startswith("_")
-            and k not in conf.secret_questions
+            and k not in secret_questions
             and isinstance(k, JSONSerializable)
             and isinstance(v, JSONSerializable)
         )
-        self.data = dict(
-            conf.data,
-            _copier_answers=answers,
-            _copier_conf=conf.copy(deep=True, exclude={"data": {"now", "make_secret"}}),
-        )
+        data["_copier_answers"] = answers
+        # The sandbox still lets templates call mutating methods like dict.update,
+        # and modifying `_copier_conf` must not alter the real configuration
+        data["_copier_conf"] = conf.copy(deep=True)
+        # Read-only, so it can be handed to every render without copying
+        self.data = MappingProxyType(data)
 
     def __call__(self, fullpath: StrOrPath) -> str:
-        relpath = Path(fullpath).relative_to(self.conf.src_path).as_posix()
-        tmpl = self.env.get_template(str(relpath))
-        return tmpl.render(**self.data)
+        fullpath = str(fullpath)
+        with suppress(KeyError):
+            return self._prerendered.pop(fullpath)
+        if fullpath.startswith(self._src_prefix):
+            # Jinja loaders expect forward slashes
+            relpath = fullpath[len(self._src_prefix) :].replace(os.sep, "/")
+        else:
+            relpath = Path(fullpath).relative_to(self.conf.src_path).as_posix()
+        tmpl = self.env.get_template(relpath)
+        return tmpl.render(self.data)
+
+    def prerender(self, fullpaths: StrOrPathSeq) -> None:
+        """Render many templates in parallel worker processes.
+
+        Results are kept until this renderer is called for each of them. Any
+        template that fails is left to be rendered (and fail) serially then.
+
+        The render context can hold unpicklable values, like functions, so the
+        workers must inherit this renderer by forking. Thus, nothing is done
+        where `fork` isn't available (or safe, like on macOS), or if there are
+        too few templates to compensate for starting the workers.
+        """
+        workers = min(_available_cpus(), len(fullpaths))
+        if (
+            len(fullpaths) < PARALLEL_RENDER_THRESHOLD
+            or workers < 2
+            or not _can_fork_workers()
+        ):
+            return
+        paths = [str(path) for path in fullpaths]
+        try:
+            # Forked workers inherit initargs as they are, without pickling
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_set_worker_renderer,
+                initargs=(self,),
+            ) as executor:
+                chunksize = max(1, len(paths) // (workers * 4))
+                results = executor.map(_render_forked, paths, chunksize=chunksize)
+                for path, content in zip(paths, results):
+                    if content is not None:
+                        self._prerendered[path] = content
+        except BrokenProcessPool:
+            # Whatever is missing will be rendered serially
+            pass
 
     def string(self, string: StrOrPath) -> str:
-        tmpl = self.env.from_string(str(string))
-        return tmpl.render(**self.data)
+        string = str(string)
+        if not any(marker in string for marker in self._markers):
+            return string
+        tmpl = self._compile_string(string)
+        return tmpl.render(self.data)
+
+
+def _available_cpus() -> int:
+    """Count the CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def _can_fork_workers() -> bool:
+    """Tell whether worker processes can (safely) be started by forking."""
+    return (
+        sys.version_info >= (3, 7)
+        and sys.platform != "darwin"
+        and "fork" in multiprocessing.get_all_start_methods()
+    )
+
+
+def _set_worker_renderer(renderer: Renderer) -> None:
+    """Keep the renderer inherited by a forked worker process."""
+    global _worker_renderer
+    _worker_renderer = renderer
+
+
+def _render_forked(fullpath: str) -> Optional[str]:
+    """Render a template with the renderer inherited from the parent process."""
+    assert _worker_renderer is not None
+    try:
+        return _worker_renderer(fullpath)
+    except Exception:
+        # Exceptions may not survive pickling; let the parent reproduce it
+        return None
 
 
 def normalize_str(text: StrOrPath, form: str = "NFD") -> str:
@@ -212,13 +353,39 @@ def force_str_end(original_str: str, end: str = "\n") -> str:
     return original_str
 
 
+@lru_cache(maxsize=32)
+def _compile_path_spec(
+    patterns: Tuple[str, ...]
+) -> Tuple[FrozenSet[str], pathspec.PathSpec]:
+    """Compile gitignore-style patterns once per distinct pattern sequence.
+
+    Plain names (without wildcards, slashes or escapes) match any path component
+    equal to them, so they are returned apart to be checked with a set lookup.
+    That is only done if no pattern is negated, because then order matters.
+    """
+    # Patterns are matched in decomposed form, the one macOS uses for file names.
+    # This is a no-op for ASCII patterns, and it runs only once per pattern set.
+    normalized = [normalize_str(p) for p in patterns]
+    names: FrozenSet[str] = frozenset()
+    if not any(p.startswith("!") for p in normalized):
+        names = frozenset(
+            p
+            for p in normalized
+            if p and p == p.strip() and not _SPECIAL_PATTERN_CHARS.intersection(p)
+        )
+        normalized = [p for p in normalized if p not in names]
+    return names, pathspec.PathSpec.from_lines("gitwildmatch", normalized)
+
+
 def create_path_filter(patterns: StrOrPathSeq) -> CheckPathFunc:
     """Returns a function that matches a path against given patterns."""
-    patterns = [normalize_str(p) for p in patterns]
-    spec = pathspec.PathSpec.from_lines("gitwildmatch", patterns)
+    names, spec = _compile_path_spec(tuple(map(str, patterns)))
 
     def match(path: StrOrPath) -> bool:
-        return spec.match_file(str(path))
+        path = str(path)
+        if names and not names.isdisjoint(path.replace(os.sep, "/").split("/")):
+            return True
+        return spec.match_file(path)
 
     return match
 
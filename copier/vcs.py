@@ -10,6 +10,11 @@ from plumbum.cmd import git
 
 from .types import OptBool, OptStr, StrOrPath
 
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None  # type: ignore
+
 __all__ = ("get_repo", "clone")
 
 GIT_PREFIX = ("git@", "git://", "git+")
@@ -33,12 +38,42 @@ def is_git_repo_root(path: Path) -> bool:
 
 def is_git_bundle(path: Path) -> bool:
     """Indicate if a path is a valid git bundle."""
+    # Spare spawning git for folders, the usual local templates
+    if not path.is_file():
+        return False
     with tempfile.TemporaryDirectory(prefix=f"{__name__}.is_git_bundle.") as dirname:
         with local.cwd(dirname):
             git("init")
             return bool(git["bundle", "verify", path] & TF)
 
 
+def describe_commit(local_repo: StrOrPath) -> str:
+    """Describe the checked out commit, like `git describe --tags --always`.
+
+    Uses libgit2 in-process when pygit2 is installed, to avoid spawning `git`.
+    """
+    if pygit2 is not None:
+        return pygit2.Repository(str(local_repo)).describe(
+            describe_strategy=pygit2.GIT_DESCRIBE_TAGS,
+            show_commit_oid_as_fallback=True,
+        )
+    with local.cwd(local_repo):
+        return git("describe", "--tags", "--always").strip()
+
+
+def is_dirty(local_repo: StrOrPath) -> bool:
+    """Indicate if a git repository has uncommitted or untracked changes.
+
+    Uses libgit2 in-process when pygit2 is installed, to avoid spawning `git`.
+    """
+    if pygit2 is not None:
+        clean = {pygit2.GIT_STATUS_CURRENT, pygit2.GIT_STATUS_IGNORED}
+        status = pygit2.Repository(str(local_repo)).status()
+        return any(flags not in clean for flags in status.values())
+    with local.cwd(local_repo):
+        return bool(git("status", "--porcelain"))
+
+
 def get_repo(url: str) -> OptStr:
     for pattern, replacement in REPLACEMENTS:
         url = re.sub(pattern, replacement, url)
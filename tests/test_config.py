@@ -1,6 +1,7 @@
 from pathlib import Path
 
 import pytest
+import yaml
 from plumbum import local
 from pydantic import ValidationError
 
@@ -249,6 +250,14 @@ def test_config_data_good_data(tmp_path):
         assert conf_dict[key] == value
 
 
+def test_config_data_cyclic_answers(tmp_path):
+    answers = yaml.safe_load("a: &x [1, *x]")
+    conf = ConfigData(src_path=tmp_path, dst_path=tmp_path, data_from_init=answers)
+    copied = conf.data_from_init["a"]
+    assert copied is not answers["a"]
+    assert copied[1] is copied
+
+
 def test_make_config_bad_data(tmp_path):
     with pytest.raises(ValidationError):
         make_config("./i_do_not_exist", tmp_path)
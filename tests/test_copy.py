@@ -4,10 +4,12 @@ import sys
 from pathlib import Path
 
 import pytest
+from jinja2 import TemplateSyntaxError
 from plumbum import local
 from plumbum.cmd import git
 
 import copier
+from copier import tools
 
 from .helpers import (
     DATA,
@@ -218,9 +220,61 @@ def test_pretend_option(tmp_path):
     assert not (tmp_path / "pyproject.toml").exists()
 
 
+def test_identical_with_other_line_endings(tmp_path: Path):
+    dst_path = tmp_path / "file.txt"
+    dst_path.write_bytes(b"lorem\r\nipsum\r\n")
+    assert copier.main.files_are_identical(dst_path, dst_path, "lorem\nipsum\n")
+    assert not copier.main.files_are_identical(dst_path, dst_path, "lorem\nipsun\n")
+
+
+def test_different_size_not_read(tmp_path: Path, monkeypatch):
+    dst_path = tmp_path / "file.txt"
+    dst_path.write_text("lorem ipsum dolor sit amet\n")
+
+    def fail(*args, **kwargs):
+        raise AssertionError("destination file was read")
+
+    monkeypatch.setattr(Path, "open", fail)
+    monkeypatch.setattr(Path, "read_text", fail)
+    assert not copier.main.files_are_identical(dst_path, dst_path, "lorem\nipsum\n")
+
+
 def test_subdirectory(tmp_path: Path):
     render(tmp_path, subdirectory="doc")
     assert not (tmp_path / "doc").exists()
     assert not (tmp_path / "config.py").exists()
     assert (tmp_path / "images").exists()
     assert (tmp_path / "manana.txt").exists()
+
+
+def test_copy_many_templates(tmp_path: Path, monkeypatch):
+    """Big templates may be rendered in parallel, with the same results."""
+    monkeypatch.setattr(tools, "_available_cpus", lambda: 2)
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    build_file_tree(
+        {src / f"file{i}.txt.tmpl": f"[[ greeting ]] {i}\n" for i in range(50)}
+    )
+    prerendered = []
+    original_prerender = tools.Renderer.prerender
+
+    def prerender(self, fullpaths):
+        original_prerender(self, fullpaths)
+        prerendered.append(len(self._prerendered))
+
+    monkeypatch.setattr(tools.Renderer, "prerender", prerender)
+    copier.copy(str(src), str(dst), data={"greeting": "hello"}, quiet=True)
+    for i in range(50):
+        assert (dst / f"file{i}.txt").read_text() == f"hello {i}\n"
+    # Make sure the parallel path ran where it is supported
+    assert prerendered == [50 if tools._can_fork_workers() else 0]
+
+
+def test_copy_many_templates_error(tmp_path: Path, monkeypatch):
+    """Errors in templates rendered in parallel are raised as usual."""
+    monkeypatch.setattr(tools, "_available_cpus", lambda: 2)
+    src, dst = tmp_path / "src", tmp_path / "dst"
+    tree = {src / f"file{i}.txt.tmpl": f"[[ {i} ]]" for i in range(50)}
+    tree[src / "file25.txt.tmpl"] = "[% broken %]"
+    build_file_tree(tree)
+    with pytest.raises(TemplateSyntaxError):
+        copier.copy(str(src), str(dst), quiet=True)
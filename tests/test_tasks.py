@@ -1,3 +1,6 @@
+import os
+import subprocess
+
 import copier
 
 from .helpers import DATA, render
@@ -15,3 +18,24 @@ def test_copy_tasks(tmp_path):
     assert (tmp_path / "hello").exists()
     assert (tmp_path / "hello").is_dir()
     assert (tmp_path / "hello" / "world").exists()
+
+
+def test_shell_and_plain_tasks(tmp_path, monkeypatch):
+    tasks = [
+        "touch [[ myvar ]]/plain.txt",
+        'echo "$STAGE" > [[ myvar ]]/stage.txt',
+        "cd [[ myvar ]] && touch builtin.txt",
+    ]
+    shells = []
+    run = subprocess.run
+
+    def spy(*args, **kwargs):
+        shells.append(kwargs["shell"])
+        return run(*args, **kwargs)
+
+    monkeypatch.setattr(subprocess, "run", spy)
+    render(tmp_path, tasks=tasks)
+    assert shells == [os.name != "posix", True, True]
+    assert (tmp_path / DATA["myvar"] / "plain.txt").exists()
+    assert (tmp_path / DATA["myvar"] / "stage.txt").read_text() == "task\n"
+    assert (tmp_path / DATA["myvar"] / "builtin.txt").exists()
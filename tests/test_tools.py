@@ -63,6 +63,28 @@ def test_create_path_filter(pattern, should_match):
     assert path_filter(pattern) == should_match
 
 
+literal_path_filter = tools.create_path_filter(("copier.yml", ".git", "*.py[co]"))
+
+
+@pytest.mark.parametrize(
+    "path,should_match",
+    (
+        # plain names match whole path components anywhere
+        ("copier.yml", True),
+        ("sub/copier.yml", True),
+        (".git/config", True),
+        ("sub/.git/config", True),
+        ("copier.yml.tmpl", False),
+        ("x.git", False),
+        # wildcard patterns still apply alongside them
+        ("sub/module.pyc", True),
+        ("sub/module.py", False),
+    ),
+)
+def test_create_path_filter_plain_names(path, should_match):
+    assert literal_path_filter(path) == should_match
+
+
 def test_lint():
     """Ensure source code formatting"""
     PoeThePoet(Path("."))(["lint", "--show-diff-on-failure", "--color=always"])